@@ -28,6 +28,9 @@ class EvalAI_Interface:
         self.EVALAI_API_SERVER = EVALAI_API_SERVER
         self.QUEUE_NAME = QUEUE_NAME
         self.CHALLENGE_PK = CHALLENGE_PK
+        # Reuse one session so the worker's polling keeps its connection to
+        # the EvalAI server alive instead of reconnecting on every request
+        self.session = requests.Session()
 
     def get_request_headers(self):
         """Function to get the header of the EvalAI request in proper format
@@ -51,7 +54,7 @@ class EvalAI_Interface:
         """
         headers = self.get_request_headers()
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method, url=url, headers=headers, data=data
             )
             response.raise_for_status()
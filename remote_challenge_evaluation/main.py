@@ -15,9 +15,12 @@ queue_name = os.environ["QUEUE_NAME"]
 challenge_pk = os.environ["CHALLENGE_PK"]
 save_dir = os.environ.get("SAVE_DIR", "./")
 
+# Shared session so submission downloads reuse pooled connections
+session = requests.Session()
+
 
 def download(submission, save_dir):
-    response = requests.get(submission["input_file"])
+    response = session.get(submission["input_file"])
     submission_file_path = os.path.join(
         save_dir, submission["input_file"].split("/")[-1]
     )